@@ -1,9 +1,56 @@
 # расчет PSF на numpy
 
+import os
+import threading
+
 import numpy as np
+import scipy.fft
 from typing import Optional
 from dataclasses import dataclass
 
+# optional GPU backend: cupy is not a required dependency, everything
+# falls back to the numpy path when it is missing or no device is present
+try:
+    import cupy as cp
+    try:
+        _HAS_CUDA = cp.cuda.is_available()
+    except Exception:
+        _HAS_CUDA = False
+except ImportError:
+    cp = None
+    _HAS_CUDA = False
+
+# optional numba-fused kernels (single pass, no grid temporaries)
+try:
+    from psf_kernels import (HAS_NUMBA, build_pupil_numba,
+                             field_intensity_numba)
+except ImportError:
+    HAS_NUMBA = False
+    build_pupil_numba = None
+    field_intensity_numba = None
+
+# optional FFTW backend with cached plans; scipy.fft otherwise
+try:
+    import pyfftw
+except ImportError:
+    pyfftw = None
+
+# FFTW plans keyed by (N, dtype); re-planning a 2048 transform costs more
+# than the transform itself. module level, because pooled compute jobs
+# build a fresh PSFCalculator each - an instance cache would never hit
+# across clicks. the lock also serializes plan execution: plans share
+# their input/output buffers (FFTW itself threads each transform)
+_PLAN_CACHE = {}
+_PLAN_LOCK = threading.Lock()
+
+# pupil geometry keyed by (N, step_pupil): rho2, astig base and aperture
+# mask only depend on the grid, not on the aberrations. module level for
+# the same reason as the plan cache - it must survive the short-lived
+# per-job calculators to actually hit across sweeps. entries are read-only
+# once built
+_GRID_CACHE = {}
+_GRID_LOCK = threading.Lock()
+
 
 @dataclass
 class PSFParams:
@@ -31,9 +78,15 @@ class PSFCalculator:
         magnification: float = 1.0,
         defocus: float = 0.0,
         astigmatism: float = 0.0,
-        diam_pupil: float = 8.0
+        diam_pupil: float = 8.0,
+        progress_cb=None
     ) -> np.ndarray:
+        """compute the PSF
 
+        progress_cb, when given, is called as progress_cb(percent, stage)
+        at phase boundaries (pupil / FFT / intensity) so callers can
+        drive a determinate progress display
+        """
         params = PSFParams(
             size=size,
             wavelength=wavelength,
@@ -45,7 +98,6 @@ class PSFCalculator:
         )
 
         # считаем параметры
-        aperture = magnification * back_aperture
         step_pupil = diam_pupil / size
         step_obj_can = 1.0 / (step_pupil * size)
         step_im_can = step_obj_can
@@ -53,22 +105,47 @@ class PSFCalculator:
         self.last_params = params
         self._step_im_microns = step_im_can * wavelength / back_aperture
 
+        if _HAS_CUDA:
+            return self._compute_gpu(size, step_pupil, step_obj_can,
+                                     defocus, astigmatism, progress_cb)
+
+        # unaberrated pupil is purely real, so its transform is Hermitian
+        # and rfft2 does half the FFT work
+        if (size % 2 == 0 and abs(defocus) < 1e-12
+                and abs(astigmatism) < 1e-12):
+            return self._compute_unaberrated(size, step_pupil, progress_cb)
+
         # зрачковая функция
         pupil = self._calc_pupil_function(
             size, step_pupil, defocus, astigmatism
         )
         self.last_pupil = pupil.copy()
 
-        # FFT и всякое
-        pupil = np.fft.ifftshift(pupil)
-        field = np.fft.ifft2(pupil)
+        if progress_cb is not None:
+            progress_cb(25, 'pupil')
+
+        # FFT и всякое: complex64 halves the bytes through the transform
+        # and workers=-1 threads it across cores
+        pupil = np.fft.ifftshift(pupil.astype(np.complex64, copy=False))
+        field = self._ifft2(pupil)
         field = np.fft.fftshift(field)
 
+        if progress_cb is not None:
+            progress_cb(75, 'FFT')
+
         # нормировка
-        field *= (step_pupil / step_obj_can)
+        field *= np.float32(step_pupil / step_obj_can)
+
+        # интенсивность (float32): the fused kernel writes re²+im² in
+        # one pass; the numpy fallback at least avoids the sqrt of abs()
+        if HAS_NUMBA:
+            intensity = field_intensity_numba(field)
+        else:
+            intensity = field.real ** 2
+            intensity += field.imag ** 2
 
-        # интенсивность
-        intensity = np.abs(field) ** 2
+        if progress_cb is not None:
+            progress_cb(95, 'intensity')
 
         # normalize to total energy = 1 (physically correct)
         total_energy = np.sum(intensity)
@@ -79,30 +156,244 @@ class PSFCalculator:
 
         return psf
 
-    def _calc_pupil_function(
+    def compute_batch(
+        self,
+        defocus_arr,
+        astig_arr,
+        size: int = 512,
+        wavelength: float = 0.555,
+        back_aperture: float = 0.5,
+        magnification: float = 1.0,
+        diam_pupil: float = 8.0
+    ) -> np.ndarray:
+        """compute PSFs for arrays of (defocus, astigmatism) pairs
+
+        builds a (K, N, N) complex64 pupil stack by broadcasting the
+        aberration coefficients over the shared grid bases and runs one
+        batched inverse FFT over the last two axes, so FFT setup and
+        threading are amortized across the whole sweep instead of paid
+        once per value. returns a (K, N, N) float32 stack, each slice
+        normalized to total energy = 1
+        """
+        defocus_arr = np.atleast_1d(np.asarray(defocus_arr, dtype=np.float64))
+        astig_arr = np.atleast_1d(np.asarray(astig_arr, dtype=np.float64))
+        defocus_arr, astig_arr = np.broadcast_arrays(defocus_arr, astig_arr)
+
+        step_pupil = diam_pupil / size
+        step_obj_can = 1.0 / (step_pupil * size)
+
+        self.last_params = PSFParams(
+            size=size,
+            wavelength=wavelength,
+            back_aperture=back_aperture,
+            magnification=magnification,
+            defocus=float(defocus_arr[0]),
+            astigmatism=float(astig_arr[0]),
+            diam_pupil=diam_pupil
+        )
+        self._step_im_microns = step_obj_can * wavelength / back_aperture
+
+        rho2, astig_base, mask = self._pupil_grid(size, step_pupil)
+        defocus_basis = (2.0 * rho2 - 1.0).astype(np.float32)
+        astig_base32 = astig_base.astype(np.float32)
+
+        # (K, N, N) phase via broadcasting, then cos/sin into the complex
+        # planes; float32 throughout to match the single-precision FFT
+        two_pi = np.float32(2.0 * np.pi)
+        phase = two_pi * (
+            defocus_arr[:, None, None].astype(np.float32) * defocus_basis +
+            astig_arr[:, None, None].astype(np.float32) * astig_base32
+        )
+        pupil = np.empty(phase.shape, dtype=np.complex64)
+        pupil.real = np.cos(phase)
+        pupil.imag = np.sin(phase)
+        pupil *= mask
+
+        pupil = np.fft.ifftshift(pupil, axes=(-2, -1))
+        field = scipy.fft.ifft2(pupil, axes=(-2, -1),
+                                workers=-1, overwrite_x=True)
+        field = np.fft.fftshift(field, axes=(-2, -1))
+        field *= np.float32(step_pupil / step_obj_can)
+
+        intensity = field.real ** 2
+        intensity += field.imag ** 2
+
+        # per-slice energy normalization
+        energy = intensity.sum(axis=(-2, -1), keepdims=True)
+        np.divide(intensity, energy, out=intensity, where=energy > 0)
+
+        return intensity
+
+    def _compute_unaberrated(self, size: int, step_pupil: float,
+                             progress_cb=None) -> np.ndarray:
+        """rfft2 fast path for the aberration-free pupil
+
+        the pupil is just the real aperture mask, so its spectrum is
+        Hermitian: transform the N x (N/2+1) half with rfft2 and rebuild
+        the full intensity from the point symmetry I[k1, k2] =
+        I[-k1 mod N, -k2 mod N]. the constant scale factors drop out in
+        the final energy normalization
+        """
+        _, _, mask = self._pupil_grid(size, step_pupil)
+        pupil = mask.astype(np.float32)
+        self.last_pupil = pupil.copy()
+
+        if progress_cb is not None:
+            progress_cb(25, 'pupil')
+
+        spectrum = scipy.fft.rfft2(np.fft.ifftshift(pupil), workers=-1)
+
+        if progress_cb is not None:
+            progress_cb(75, 'FFT')
+
+        half = spectrum.real ** 2
+        half += spectrum.imag ** 2
+
+        n = size
+        intensity = np.empty((n, n), dtype=np.float32)
+        intensity[:, :n // 2 + 1] = half
+        # missing columns k2 = n/2+1..n-1 mirror columns n-k2 = n/2-1..1,
+        # with rows flipped about zero frequency (row 0 stays, 1..n-1 reverse)
+        tail = half[:, 1:n // 2][:, ::-1]
+        intensity[:, n // 2 + 1:] = np.roll(tail[::-1, :], 1, axis=0)
+
+        psf = np.fft.fftshift(intensity)
+
+        if progress_cb is not None:
+            progress_cb(95, 'intensity')
+
+        total_energy = np.sum(psf)
+        if total_energy > 0:
+            psf = psf / total_energy
+
+        return psf
+
+    def _ifft2(self, pupil: np.ndarray) -> np.ndarray:
+        """inverse 2D FFT through a shared cached FFTW plan when available"""
+        if pyfftw is None:
+            return scipy.fft.ifft2(pupil, workers=-1, overwrite_x=True)
+
+        key = (pupil.shape[0], pupil.dtype.str)
+        with _PLAN_LOCK:
+            cached = _PLAN_CACHE.get(key)
+            if cached is None:
+                inp = pyfftw.empty_aligned(pupil.shape, dtype=pupil.dtype)
+                out = pyfftw.empty_aligned(pupil.shape, dtype=pupil.dtype)
+                plan = pyfftw.FFTW(inp, out, axes=(0, 1),
+                                   direction='FFTW_BACKWARD',
+                                   flags=('FFTW_MEASURE',),
+                                   threads=os.cpu_count())
+                cached = (plan, inp, out)
+                _PLAN_CACHE[key] = cached
+
+            plan, inp, out = cached
+            inp[:] = pupil
+            plan()
+            # copy out of the plan's buffer, it is reused on the next call
+            return out.copy()
+
+    def _compute_gpu(
         self,
         size: int,
         step_pupil: float,
+        step_obj_can: float,
         defocus: float,
-        astigmatism: float
+        astigmatism: float,
+        progress_cb=None
     ) -> np.ndarray:
+        """same pipeline as the numpy path, run on the GPU via cupy
 
-        # сетка
-        idx = np.arange(size)
+        the pupil grid, aberration phase and ifft2 all stay on the
+        device; only the final PSF is copied back to the host
+        """
+        idx = cp.arange(size)
         coords = (idx - size // 2) * step_pupil
-        X, Y = np.meshgrid(coords, coords)
+        sq = coords ** 2
 
-        # полярные координаты
-        rho2 = X**2 + Y**2
-        phi = np.arctan2(X, Y)
-
-        # маска зрачка
+        # broadcasted 1-D squares, same layout as the CPU grid
+        rho2 = sq[None, :] + sq[:, None]
+        astig_base = sq[:, None] - sq[None, :]
         mask = rho2 <= 1.0
 
+        W = 2.0 * cp.pi * (
+            defocus * (2.0 * rho2 - 1.0) +
+            astigmatism * astig_base
+        )
+        pupil = cp.exp(1j * W) * mask
+        self.last_pupil = cp.asnumpy(pupil)
+
+        if progress_cb is not None:
+            progress_cb(25, 'pupil')
+
+        # single precision through the transform, same as the CPU path
+        pupil = cp.fft.ifftshift(pupil.astype(cp.complex64))
+        field = cp.fft.fftshift(cp.fft.ifft2(pupil))
+
+        if progress_cb is not None:
+            progress_cb(75, 'FFT')
+
+        field *= cp.float32(step_pupil / step_obj_can)
+
+        intensity = cp.abs(field) ** 2
+
+        if progress_cb is not None:
+            progress_cb(95, 'intensity')
+        total_energy = cp.sum(intensity)
+        if total_energy > 0:
+            intensity /= total_energy
+
+        return cp.asnumpy(intensity)
+
+    def _pupil_grid(self, size: int, step_pupil: float):
+        """shared cached pupil geometry: (rho2, astig base, aperture mask)"""
+        key = (size, round(step_pupil, 12))
+        cached = _GRID_CACHE.get(key)
+        if cached is None:
+            with _GRID_LOCK:
+                cached = _GRID_CACHE.get(key)
+                if cached is None:
+                    # сетка: broadcast a single 1-D array of squared coords
+                    # instead of materializing full X/Y grids via meshgrid
+                    idx = np.arange(size)
+                    coords = (idx - size // 2) * step_pupil
+                    sq = coords ** 2
+
+                    # полярные координаты: x varies along columns,
+                    # y along rows
+                    rho2 = sq[None, :] + sq[:, None]
+                    # with phi = arctan2(X, Y):
+                    # rho2*cos(2*phi) == Y**2 - X**2
+                    astig_base = sq[:, None] - sq[None, :]
+
+                    # маска зрачка
+                    mask = rho2 <= 1.0
+
+                    cached = (rho2, astig_base, mask)
+                    _GRID_CACHE[key] = cached
+
+        return cached
+
+    def _calc_pupil_function(
+        self,
+        size: int,
+        step_pupil: float,
+        defocus: float,
+        astigmatism: float
+    ) -> np.ndarray:
+
+        # fused jit kernel: one streaming write instead of several
+        # full-grid temporaries (rho2, phi, W, mask)
+        if HAS_NUMBA:
+            return build_pupil_numba(size, step_pupil, defocus, astigmatism)
+
+        # geometry depends only on (size, step_pupil): reuse it across
+        # defocus/astigmatism sweeps so only the phase is re-evaluated
+        rho2, astig_base, mask = self._pupil_grid(size, step_pupil)
+
         # аберрация
         W = 2.0 * np.pi * (
             defocus * (2.0 * rho2 - 1.0) +
-            astigmatism * rho2 * np.cos(2.0 * phi)
+            astigmatism * astig_base
         )
 
         pupil = np.exp(1j * W) * mask
@@ -0,0 +1,89 @@
+# JIT-скомпилированные ядра (numba опционально)
+
+import math
+
+import numpy as np
+
+# numba is optional: without it the caller keeps the plain numpy path
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _build_pupil_impl(size, step_pupil, defocus, astigmatism,
+                      out_real, out_imag):
+    """fill the complex pupil (as real/imag planes) in one streaming pass
+
+    fuses grid construction, the aperture mask and the aberration phase
+    W = 2π(defocus(2ρ²−1) + astig·ρ²cos2φ); with φ = atan2(x, y) the
+    astigmatism term reduces to astig·(y²−x²), so no trig on the angle
+    """
+    half = size // 2
+    two_pi = 2.0 * math.pi
+    for i in prange(size):
+        y = (i - half) * step_pupil
+        y2 = y * y
+        for j in range(size):
+            x = (j - half) * step_pupil
+            rho2 = x * x + y2
+            if rho2 <= 1.0:
+                w = two_pi * (defocus * (2.0 * rho2 - 1.0) +
+                              astigmatism * (y2 - x * x))
+                out_real[i, j] = math.cos(w)
+                out_imag[i, j] = math.sin(w)
+            else:
+                out_real[i, j] = 0.0
+                out_imag[i, j] = 0.0
+
+
+if HAS_NUMBA:
+    build_pupil = njit(parallel=True, fastmath=True,
+                       cache=True)(_build_pupil_impl)
+else:
+    build_pupil = None
+
+
+def build_pupil_numba(size: int, step_pupil: float,
+                      defocus: float, astigmatism: float) -> np.ndarray:
+    """build the complex pupil via the numba kernel
+
+    only call when HAS_NUMBA is True
+    """
+    # float32 planes -> complex64 pupil, matching the single-precision FFT
+    out_real = np.empty((size, size), dtype=np.float32)
+    out_imag = np.empty((size, size), dtype=np.float32)
+    build_pupil(size, step_pupil, defocus, astigmatism, out_real, out_imag)
+    return out_real + 1j * out_imag
+
+
+def _field_intensity_impl(field, out):
+    """|field|² in one streaming pass
+
+    np.abs(field)**2 walks the array twice and allocates two full-size
+    temporaries (the modulus and its square); this writes re²+im²
+    straight into out and skips the sqrt entirely
+    """
+    n, m = field.shape
+    for i in prange(n):
+        for j in range(m):
+            v = field[i, j]
+            out[i, j] = v.real * v.real + v.imag * v.imag
+
+
+if HAS_NUMBA:
+    field_intensity = njit(parallel=True, fastmath=True,
+                           cache=True)(_field_intensity_impl)
+else:
+    field_intensity = None
+
+
+def field_intensity_numba(field: np.ndarray) -> np.ndarray:
+    """|field|² via the numba kernel
+
+    only call when HAS_NUMBA is True
+    """
+    out = np.empty(field.shape, dtype=np.float32)
+    field_intensity(field, out)
+    return out
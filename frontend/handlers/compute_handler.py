@@ -5,9 +5,9 @@ import numpy as np
 import time
 from typing import List
 from PyQt6.QtWidgets import QMessageBox, QProgressDialog
-from PyQt6.QtCore import Qt
-from scipy.signal import fftconvolve
-from frontend.models.compute_thread import PSFComputeThread
+from PyQt6.QtCore import Qt, QThreadPool
+import scipy.fft
+from frontend.models.compute_thread import PSFComputeJob, PSFJobSignals
 from frontend.utils.calculations import calculate_strehl_ratio
 
 logger = logging.getLogger(__name__)
@@ -19,11 +19,28 @@ class ComputeHandler:
     def __init__(self, psf_calculator, psf_tab_ref):
         self.calculator = psf_calculator
         self.parent = psf_tab_ref
-        self.compute_thread = None
-        self.computing_rows = []
         self.computation_cancelled = False
         self.progress_dialog = None
 
+        # pooled computation state (compute_multiple_rows)
+        self.job_signals = PSFJobSignals()
+        self.job_signals.result_ready.connect(self._on_job_result)
+        self.job_signals.error_occurred.connect(self._on_job_error)
+
+        # single-row jobs share the pool but skip the batch bookkeeping
+        self.single_job_signals = PSFJobSignals()
+        self.single_job_signals.result_ready.connect(self.on_row_computed)
+        self.single_job_signals.error_occurred.connect(self.on_row_error)
+        self.single_job_signals.progress.connect(self._on_single_job_progress)
+        self.single_progress_dialog = None
+        self.active_jobs = []
+        self.jobs_total = 0
+        self.jobs_done = 0
+        # batch generation: bumped on every new batch and on cancel, so
+        # late callbacks from a superseded batch are dropped instead of
+        # corrupting the current batch's bookkeeping
+        self.job_generation = 0
+
     def compute_row(self, idx: int):
         """compute PSF for one row"""
         if idx < 0 or idx >= len(self.parent.table_rows):
@@ -46,19 +63,39 @@ class ComputeHandler:
         row.status = "computing"
         self.parent.table_handler.update_table_row(idx)
 
-        params = row.get_params()
-
-        thread = PSFComputeThread(params)
-        thread.result_ready.connect(
-            lambda psf, time, info: self.on_row_computed(idx, psf, time, info))
-        thread.error_occurred.connect(
-            lambda err: self.on_row_error(idx, err))
+        # determinate progress driven by the calculator's phase-boundary
+        # callbacks, so the dialog repaints a few times per compute
+        # instead of pumping an indeterminate animation
+        self.single_progress_dialog = QProgressDialog(
+            f"Computing PSF for row {idx + 1}...", None, 0, 100, self.parent)
+        self.single_progress_dialog.setWindowModality(
+            Qt.WindowModality.WindowModal)
+        self.single_progress_dialog.setMinimumDuration(0)
+        self.single_progress_dialog.show()
+
+        # reuse the pool's worker threads instead of constructing a new
+        # QThread per click; the job carries the row index back
+        job = PSFComputeJob(idx, row.get_params(), self.single_job_signals)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_single_job_progress(self, idx: int, percent: int, stage: str):
+        """milestone progress from a single-row job"""
+        dialog = self.single_progress_dialog
+        if dialog is None:
+            return
+        # label first: setValue on a modal dialog processes events and may
+        # deliver the finished result, which closes the dialog
+        dialog.setLabelText(
+            f"Computing PSF for row {idx + 1}: {stage}...")
+        dialog.setValue(percent)
 
-        self.compute_thread = thread
-        thread.start()
+    def _close_single_progress(self):
+        if self.single_progress_dialog is not None:
+            self.single_progress_dialog.close()
+            self.single_progress_dialog = None
 
     def compute_multiple_rows(self, indices: List[int]):
-        """compute multiple rows sequentially"""
+        """compute multiple rows in parallel on the global thread pool"""
         if not indices:
             return
 
@@ -66,13 +103,35 @@ class ComputeHandler:
         if not indices:
             return
 
-        self.computing_rows = indices.copy()
+        # validate upfront; invalid rows are marked and skipped
+        from frontend.utils.validators import validate_row_params
+        valid_indices = []
+        for idx in indices:
+            row = self.parent.table_rows[idx]
+            is_valid, error_msg = validate_row_params(row)
+            if not is_valid:
+                row.status = "error"
+                row.error_message = error_msg
+                self.parent.table_handler.update_table_row(idx)
+                logger.error(
+                    f"Row {idx + 1} validation failed: {error_msg}")
+            else:
+                valid_indices.append(idx)
+
+        if not valid_indices:
+            self.parent.compute_system_after = False
+            return
+
         self.computation_cancelled = False
+        self.job_generation += 1
+        self.jobs_total = len(valid_indices)
+        self.jobs_done = 0
+        self.active_jobs = []
 
         self.progress_dialog = QProgressDialog(
-            f"Computing PSF 0/{len(indices)}...",
+            f"Computing PSF 0/{self.jobs_total}...",
             "Cancel",
-            0, len(indices),
+            0, self.jobs_total,
             self.parent
         )
         self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
@@ -80,43 +139,37 @@ class ComputeHandler:
         self.progress_dialog.canceled.connect(self._on_computation_cancelled)
         self.progress_dialog.show()
 
-        self._compute_next_in_queue()
-
-    def _compute_next_in_queue(self):
-        """compute next row in queue"""
-        if self.computation_cancelled or not self.computing_rows:
-            if self.progress_dialog:
-                self.progress_dialog.close()
-            logger.info("Computation queue finished")
-            return
-
-        idx = self.computing_rows.pop(0)
-
-        if self.progress_dialog:
-            total_rows = self.progress_dialog.maximum()
-            current_row = total_rows - len(self.computing_rows)
-            self.progress_dialog.setValue(current_row)
-            self.progress_dialog.setLabelText(
-                f"Computing PSF {current_row}/{total_rows}...")
+        pool = QThreadPool.globalInstance()
+        for idx in valid_indices:
+            row = self.parent.table_rows[idx]
+            row.status = "computing"
+            self.parent.table_handler.update_table_row(idx)
 
-        self.compute_row(idx)
+            job = PSFComputeJob(idx, row.get_params(), self.job_signals,
+                                self.job_generation)
+            self.active_jobs.append(job)
+            pool.start(job)
 
-    def on_row_computed(self, idx: int, psf_data: np.ndarray, elapsed_time: float, info: dict):
-        """callback when row computation finishes"""
-        if idx < 0 or idx >= len(self.parent.table_rows):
-            return
+        logger.info(
+            f"Submitted {self.jobs_total} PSF jobs to thread pool "
+            f"({pool.maxThreadCount()} threads)")
 
+    def _store_row_result(self, idx: int, psf_data: np.ndarray, elapsed_time: float, info: dict):
+        """store a finished PSF on its row and refresh display"""
         row = self.parent.table_rows[idx]
         row.psf_data = psf_data
+        row.psf_fft = None  # cached transform is stale
+        row.psf_fft_shape = None
+        row.psf_display = None
         row.compute_time = elapsed_time
         row.status = "complete"
         row.error_message = ""
 
-        logger.info(
-            f"Row {idx + 1} PSF computed: defocus={row.defocus}, max={np.max(psf_data):.6f}")
-
-        # calculate Strehl ratio
-        row.strehl_ratio = calculate_strehl_ratio(psf_data)
+        # scalars come precomputed from the worker thread; fall back to
+        # computing here for older callers that don't fill the info dict
+        row.strehl_ratio = info.get(
+            'strehl_ratio', calculate_strehl_ratio(psf_data))
+        row.psf_max = info.get('max_intensity', float(np.max(psf_data)))
 
         self.parent.table_handler.update_table_row(idx)
 
@@ -125,7 +178,9 @@ class ComputeHandler:
 
         # update plots only if this is the selected row AND not computing for system PSF
         if idx == self.parent.selected_row_idx and not self.parent.compute_system_after:
-            self.parent.current_psf = psf_data
+            # display copy only, row keeps full precision
+            self.parent.current_psf = self.parent._display_copy(psf_data, row)
+            self.parent.current_psf_max = row.psf_max
             self.parent.current_params = row.get_params()
             self.parent.current_step_microns = info['step_microns']
             self.parent.current_compute_time = elapsed_time
@@ -133,21 +188,20 @@ class ComputeHandler:
             self.parent._update_plots()
             self.parent._update_info()
 
-        if self.computing_rows:
-            self._compute_next_in_queue()
-        else:
-            if self.progress_dialog:
-                # disconnect canceled signal before closing
-                self.progress_dialog.canceled.disconnect()
-                self.progress_dialog.close()
-            # check if we need to compute system PSF after all rows
-            if self.parent.compute_system_after:
-                self.parent.compute_system_after = False
-                logger.info("All rows computed, computing system PSF...")
-                self.compute_system_psf()
-
-    def on_row_error(self, idx: int, error_msg: str):
-        """callback when row computation fails"""
+    def on_row_computed(self, generation: int, idx: int, psf_data: np.ndarray,
+                        elapsed_time: float, info: dict):
+        """callback when a single-row computation finishes"""
+        self._close_single_progress()
+
+        if idx < 0 or idx >= len(self.parent.table_rows):
+            return
+
+        self._store_row_result(idx, psf_data, elapsed_time, info)
+
+    def on_row_error(self, generation: int, idx: int, error_msg: str):
+        """callback when a single-row computation fails"""
+        self._close_single_progress()
+
         if idx < 0 or idx >= len(self.parent.table_rows):
             return
 
@@ -158,39 +212,150 @@ class ComputeHandler:
 
         logger.error(f"Row {idx + 1} computation error: {error_msg}")
 
-        if self.computing_rows:
-            self._compute_next_in_queue()
-        else:
-            if self.progress_dialog:
-                # disconnect canceled signal before closing
-                self.progress_dialog.canceled.disconnect()
-                self.progress_dialog.close()
+    def _on_job_result(self, generation: int, idx: int, psf_data: np.ndarray,
+                       elapsed_time: float, info: dict):
+        """callback when a pooled job finishes"""
+        if generation != self.job_generation:
+            logger.info(
+                "Ignoring stale result for row %d (cancelled batch)", idx + 1)
+            return
+
+        if 0 <= idx < len(self.parent.table_rows):
+            self._store_row_result(idx, psf_data, elapsed_time, info)
+
+        self._on_job_done()
+
+    def _on_job_error(self, generation: int, idx: int, error_msg: str):
+        """callback when a pooled job fails"""
+        if generation != self.job_generation:
+            logger.info(
+                "Ignoring stale error for row %d (cancelled batch)", idx + 1)
+            return
+
+        if 0 <= idx < len(self.parent.table_rows):
+            row = self.parent.table_rows[idx]
+            row.status = "error"
+            row.error_message = error_msg
+            self.parent.table_handler.update_table_row(idx)
+            logger.error(f"Row {idx + 1} computation error: {error_msg}")
+
+        self._on_job_done()
+
+    def _on_job_done(self):
+        """common bookkeeping after each pooled job"""
+        self.jobs_done += 1
+
+        if self.progress_dialog and not self.computation_cancelled:
+            self.progress_dialog.setValue(self.jobs_done)
+            self.progress_dialog.setLabelText(
+                f"Computing PSF {self.jobs_done}/{self.jobs_total}...")
+
+        if self.jobs_done < self.jobs_total:
+            return
+
+        self.active_jobs = []
+        if self.progress_dialog:
+            # disconnect canceled signal before closing
+            self.progress_dialog.canceled.disconnect()
+            self.progress_dialog.close()
+            self.progress_dialog = None
+
+        logger.info("Computation queue finished")
+
+        # check if we need to compute system PSF after all rows
+        if self.parent.compute_system_after and not self.computation_cancelled:
+            self.parent.compute_system_after = False
+
+            # the batch can finish with failed rows (validation skips,
+            # runtime errors); the system PSF needs every row's data
+            incomplete = [
+                idx for idx, row in enumerate(self.parent.table_rows)
+                if row.status != "complete" or row.psf_data is None]
+            if incomplete:
+                rows_str = ", ".join(str(i + 1) for i in incomplete)
+                logger.error(
+                    f"System PSF aborted: rows not computed: {rows_str}")
+                QMessageBox.warning(
+                    self.parent, "System PSF",
+                    f"Cannot compute system PSF: row(s) {rows_str} "
+                    f"failed to compute.")
+                return
+
+            logger.info("All rows computed, computing system PSF...")
+            self.compute_system_psf()
 
     def _on_computation_cancelled(self):
         """cancel computation"""
         self.computation_cancelled = True
-        self.computing_rows.clear()
         self.parent.compute_system_after = False  # reset flag
+
+        # invalidate this batch: any job still running reports with the
+        # old generation and its callback is dropped
+        self.job_generation += 1
+
+        # jobs not yet started by the pool return immediately
+        for job in self.active_jobs:
+            job.cancelled = True
+        self.active_jobs = []
+
+        # reset rows that never got computed
+        for idx, row in enumerate(self.parent.table_rows):
+            if row.status == "computing":
+                row.status = "not_computed"
+                self.parent.table_handler.update_table_row(idx)
+
+        if self.progress_dialog:
+            self.progress_dialog = None
+
         logger.info("Computation cancelled by user")
 
     def compute_system_psf(self):
         """compute system PSF by convolving all row PSFs"""
-        if not self.parent.table_rows:
+        rows = self.parent.table_rows
+        if not rows:
             return
 
-        start_time = time.time()
+        # defensive: never run the convolution over rows without data
+        if any(row.psf_data is None for row in rows):
+            logger.error("System PSF requested with uncomputed rows")
+            return
 
-        # start with first row PSF (already normalized to energy=1)
-        result_psf = self.parent.table_rows[0].psf_data.copy()
+        start_time = time.time()
 
-        # convolve with each subsequent row
-        for idx in range(1, len(self.parent.table_rows)):
-            row = self.parent.table_rows[idx]
-            result_psf = fftconvolve(result_psf, row.psf_data, mode='same')
-            # normalize to energy=1 after each convolution (physically correct)
-            total_energy = np.sum(result_psf)
-            if total_energy > 0:
-                result_psf = result_psf / total_energy
+        if len(rows) == 1:
+            result_psf = rows[0].psf_data.copy()
+        else:
+            # accumulate in Fourier space: one multiply per row and a single
+            # inverse transform instead of one full convolution per pair.
+            # per-row transforms are cached on the row, so recomputing after
+            # editing one row only redoes that row's rfft2.
+            n = rows[0].psf_data.shape[0]
+            full = len(rows) * (n - 1) + 1
+            fast = scipy.fft.next_fast_len(full)
+            fshape = (fast, fast)
+
+            spectrum = None
+            for row in rows:
+                if row.psf_fft is None or row.psf_fft_shape != fshape:
+                    row.psf_fft = scipy.fft.rfft2(
+                        row.psf_data, fshape, workers=-1)
+                    row.psf_fft_shape = fshape
+                if spectrum is None:
+                    spectrum = row.psf_fft.copy()
+                else:
+                    spectrum *= row.psf_fft
+
+            result = scipy.fft.irfft2(spectrum, fshape, workers=-1)
+
+            # crop the central n×n window; each row PSF is centered at n//2,
+            # so the combined peak sits at len(rows)*(n//2)
+            start = (len(rows) - 1) * (n // 2)
+            result_psf = result[start:start + n, start:start + n]
+
+        # normalize to energy=1 (physically correct)
+        total_energy = np.sum(result_psf)
+        if total_energy > 0:
+            result_psf = result_psf / total_energy
 
         self.parent.system_psf = result_psf
         self.parent.system_psf_valid = True
@@ -212,7 +377,9 @@ class ComputeHandler:
 
         # use parameters from first row for display
         first_row = self.parent.table_rows[0]
-        self.parent.current_psf = self.parent.system_psf
+        self.parent.current_psf = self.parent._display_copy(
+            self.parent.system_psf)
+        self.parent.current_psf_max = float(np.max(self.parent.system_psf))
         self.parent.current_params = first_row.get_params()
         self.parent.current_step_microns = first_row.step_obj_microns
         self.parent.current_compute_time = self.parent.system_compute_time
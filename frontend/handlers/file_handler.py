@@ -117,10 +117,10 @@ class FileHandler:
             self.parent.source_param_spin.blockSignals(False)
             self.parent.control_panel.sample_size_combo.blockSignals(False)
 
-            # load rows
-            for row_dict in config['rows']:
-                row = OpticalSystemRow.from_dict(row_dict)
-                self.parent.table_handler.add_row(row)
+            # load rows in one batch (single resize + repaint)
+            self.parent.table_handler.add_rows(
+                [OpticalSystemRow.from_dict(row_dict)
+                 for row_dict in config['rows']])
 
             # invalidate system PSF
             self.parent.system_psf_valid = False
@@ -215,7 +215,7 @@ class FileHandler:
             center_idx = size // 2
             x_section = psf_normalized[center_idx, :]
             ax1.plot(coords, x_section, 'r-', label='X section', linewidth=2)
-            y_section = psf_normalized[:, center_idx]
+            y_section = np.ascontiguousarray(psf_normalized[:, center_idx])
             ax1.plot(coords, y_section, 'b-', label='Y section', linewidth=2)
             ax1.set_xlabel(f'Position [{unit_label}]')
             ax1.set_ylabel('Normalized Intensity')
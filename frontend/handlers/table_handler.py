@@ -5,6 +5,7 @@ import random
 from PyQt6.QtWidgets import QTableWidgetItem
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QBrush
+from frontend.ui_components.table_widget import Col
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +24,13 @@ class TableHandler:
         units = self.parent.source_param_units_combo.currentText()
 
         if choice == 'Diam pupil':
-            return self.parent.COL_DIAM_PUP
+            return Col.DIAM_PUP
         elif choice == 'Step pupil':
-            return self.parent.COL_STEP_PUP
+            return Col.STEP_PUP
         elif choice == 'Step object':
-            return self.parent.COL_STEP_OBJ_CAN if units == 'c.u.' else self.parent.COL_STEP_OBJ_UM
+            return Col.STEP_OBJ_CAN if units == 'c.u.' else Col.STEP_OBJ_UM
         elif choice == 'Step image':
-            return self.parent.COL_STEP_IM_CAN if units == 'c.u.' else self.parent.COL_STEP_IM_UM
+            return Col.STEP_IM_CAN if units == 'c.u.' else Col.STEP_IM_UM
         return -1
 
     def add_row(self, row) -> int:
@@ -45,31 +46,58 @@ class TableHandler:
 
         return idx
 
-    def insert_table_row(self, idx: int):
-        """insert row into QTableWidget"""
-        from frontend.models.optical_row import OpticalSystemRow
+    def add_rows(self, rows: list):
+        """add multiple rows with one table resize and one repaint"""
+        if not rows:
+            return
 
-        row_data = self.rows[idx]
+        start = len(self.rows)
+        self.rows.extend(rows)
+
+        self.table.setUpdatesEnabled(False)
+        signals_were_blocked = self.table.blockSignals(True)
+        try:
+            self.table.setRowCount(start + len(rows))
+            for idx in range(start, start + len(rows)):
+                self.parent._recalculate_row_params(idx)
+                self._populate_table_row(idx)
+        finally:
+            self.table.blockSignals(signals_were_blocked)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
+
+        # invalidate system PSF
+        self.parent.system_psf_valid = False
+
+        logger.info(f"Added {len(rows)} rows in bulk")
 
+    def insert_table_row(self, idx: int):
+        """insert row into QTableWidget"""
         self.table.blockSignals(True)
         self.table.insertRow(idx)
+        self._populate_table_row(idx)
+        self.table.blockSignals(False)
+
+    def _populate_table_row(self, idx: int):
+        """fill cells of an existing (empty) table row from row data"""
+        row_data = self.rows[idx]
 
         source_col = self.get_source_param_column()
 
         # editable: basic params
-        self.table.setItem(idx, self.parent.COL_LAMBDA,
+        self.table.setItem(idx, Col.LAMBDA,
                           QTableWidgetItem(f"{row_data.wavelength:.3f}"))
-        self.table.setItem(idx, self.parent.COL_NA,
+        self.table.setItem(idx, Col.NA,
                           QTableWidgetItem(f"{row_data.back_aperture:.2f}"))
-        self.table.setItem(idx, self.parent.COL_MAG,
+        self.table.setItem(idx, Col.MAG,
                           QTableWidgetItem(f"{row_data.magnification:.1f}"))
-        self.table.setItem(idx, self.parent.COL_DEFOC,
+        self.table.setItem(idx, Col.DEFOC,
                           QTableWidgetItem(f"{row_data.defocus:.2f}"))
-        self.table.setItem(idx, self.parent.COL_ASTIG,
+        self.table.setItem(idx, Col.ASTIG,
                           QTableWidgetItem(f"{row_data.astigmatism:.2f}"))
 
         # computed columns - all read-only and gray
-        for col in range(self.parent.COL_STEP_OBJ_CAN, self.parent.COL_STEP_PUP + 1):
+        for col in range(Col.STEP_OBJ_CAN, Col.STEP_PUP + 1):
             item = QTableWidgetItem("")
             item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
 
@@ -84,15 +112,14 @@ class TableHandler:
         # strehl (read-only)
         item = QTableWidgetItem("—")
         item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.table.setItem(idx, self.parent.COL_STREHL, item)
+        self.table.setItem(idx, Col.STREHL, item)
 
         # status (read-only)
         item = QTableWidgetItem(row_data.status)
         item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.table.setItem(idx, self.parent.COL_STATUS, item)
+        self.table.setItem(idx, Col.STATUS, item)
 
         self.update_table_row(idx)
-        self.table.blockSignals(False)
 
     def update_table_row(self, idx: int):
         """update table display from row data"""
@@ -101,43 +128,45 @@ class TableHandler:
 
         row_data = self.rows[idx]
 
-        self.table.blockSignals(True)
+        # restore the previous state on exit so callers can batch updates
+        # with their own outer blockSignals(True)
+        signals_were_blocked = self.table.blockSignals(True)
 
         # update input params (editable columns)
-        self.table.item(idx, self.parent.COL_LAMBDA).setText(
+        self.table.item(idx, Col.LAMBDA).setText(
             f"{row_data.wavelength:.3f}")
-        self.table.item(idx, self.parent.COL_NA).setText(
+        self.table.item(idx, Col.NA).setText(
             f"{row_data.back_aperture:.2f}")
-        self.table.item(idx, self.parent.COL_MAG).setText(
+        self.table.item(idx, Col.MAG).setText(
             f"{row_data.magnification:.1f}")
-        self.table.item(idx, self.parent.COL_DEFOC).setText(
+        self.table.item(idx, Col.DEFOC).setText(
             f"{row_data.defocus:.2f}")
-        self.table.item(idx, self.parent.COL_ASTIG).setText(
+        self.table.item(idx, Col.ASTIG).setText(
             f"{row_data.astigmatism:.2f}")
 
         # update computed params
-        self.table.item(idx, self.parent.COL_STEP_OBJ_CAN).setText(
+        self.table.item(idx, Col.STEP_OBJ_CAN).setText(
             f"{row_data.step_obj_can:.6f}")
-        self.table.item(idx, self.parent.COL_STEP_OBJ_UM).setText(
+        self.table.item(idx, Col.STEP_OBJ_UM).setText(
             f"{row_data.step_obj_microns:.6f}")
-        self.table.item(idx, self.parent.COL_STEP_IM_CAN).setText(
+        self.table.item(idx, Col.STEP_IM_CAN).setText(
             f"{row_data.step_im_can:.6f}")
-        self.table.item(idx, self.parent.COL_STEP_IM_UM).setText(
+        self.table.item(idx, Col.STEP_IM_UM).setText(
             f"{row_data.step_im_microns:.6f}")
-        self.table.item(idx, self.parent.COL_DIAM_PUP).setText(
+        self.table.item(idx, Col.DIAM_PUP).setText(
             f"{row_data.diam_pupil:.3f}")
-        self.table.item(idx, self.parent.COL_STEP_PUP).setText(
+        self.table.item(idx, Col.STEP_PUP).setText(
             f"{row_data.step_pupil:.6f}")
 
         # update strehl
         if row_data.status == "complete":
-            self.table.item(idx, self.parent.COL_STREHL).setText(
+            self.table.item(idx, Col.STREHL).setText(
                 f"{row_data.strehl_ratio:.4f}")
         else:
-            self.table.item(idx, self.parent.COL_STREHL).setText("—")
+            self.table.item(idx, Col.STREHL).setText("—")
 
         # update status
-        self.table.item(idx, self.parent.COL_STATUS).setText(row_data.status)
+        self.table.item(idx, Col.STATUS).setText(row_data.status)
 
         # color code by status (dark theme colors)
         if row_data.status == "not_computed":
@@ -152,13 +181,13 @@ class TableHandler:
             color = QColor(60, 60, 60)
 
         # apply color to editable cells
-        for col in [self.parent.COL_LAMBDA, self.parent.COL_NA, self.parent.COL_MAG,
-                    self.parent.COL_DEFOC, self.parent.COL_ASTIG]:
+        for col in [Col.LAMBDA, Col.NA, Col.MAG,
+                    Col.DEFOC, Col.ASTIG]:
             self.table.item(idx, col).setBackground(QBrush(color))
 
         # update colors for computed columns (source parameter highlighting)
         source_col = self.get_source_param_column()
-        for col in range(self.parent.COL_STEP_OBJ_CAN, self.parent.COL_STEP_PUP + 1):
+        for col in range(Col.STEP_OBJ_CAN, Col.STEP_PUP + 1):
             item = self.table.item(idx, col)
             if item:
                 if col == source_col:
@@ -166,7 +195,7 @@ class TableHandler:
                 else:
                     item.setBackground(QBrush(QColor(80, 80, 80)))  # dark gray
 
-        self.table.blockSignals(False)
+        self.table.blockSignals(signals_were_blocked)
 
     def delete_row(self, idx: int, clear_plots: bool = True):
         """delete a row"""
@@ -295,7 +324,7 @@ class TableHandler:
         source_col = self.get_source_param_column()
 
         for row_idx in range(len(self.rows)):
-            for col in range(self.parent.COL_STEP_OBJ_CAN, self.parent.COL_STEP_PUP + 1):
+            for col in range(Col.STEP_OBJ_CAN, Col.STEP_PUP + 1):
                 item = self.table.item(row_idx, col)
                 if item:
                     if col == source_col:
@@ -1,6 +1,6 @@
 # frontend models
 
 from .optical_row import OpticalSystemRow
-from .compute_thread import PSFComputeThread
+from .compute_thread import PSFComputeJob, PSFJobSignals
 
-__all__ = ['OpticalSystemRow', 'PSFComputeThread']
+__all__ = ['OpticalSystemRow', 'PSFComputeJob', 'PSFJobSignals']
@@ -1,42 +1,78 @@
-# PSF computation thread
+# PSF computation workers (pooled QRunnable jobs)
 
 import time
 import logging
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 import numpy as np
 from psf_wrapper import PSFCalculator
+from frontend.utils.calculations import calculate_strehl_ratio
 
 logger = logging.getLogger(__name__)
 
 
-class PSFComputeThread(QThread):
-    """background thread for PSF computation"""
+def _result_info(calc: PSFCalculator, psf_data: np.ndarray) -> dict:
+    """scalars derived from a finished PSF, computed off the GUI thread"""
+    return {
+        'step_microns': calc.get_step_microns(),
+        'max_intensity': float(psf_data.max()),
+        'strehl_ratio': calculate_strehl_ratio(psf_data),
+    }
 
-    result_ready = pyqtSignal(np.ndarray, float, dict)
-    error_occurred = pyqtSignal(str)
 
-    def __init__(self, params):
+class PSFJobSignals(QObject):
+    """signals for pooled PSF jobs (QRunnable can't emit directly)"""
+
+    # result_ready carries (generation, row idx, float32 PSF, elapsed
+    # seconds, info); the whole pipeline is single precision, display only
+    # needs float32. the generation tags which batch a job belongs to, so
+    # late callbacks from a cancelled batch can be recognized and dropped
+    result_ready = pyqtSignal(int, int, np.ndarray, float, dict)
+    error_occurred = pyqtSignal(int, int, str)
+    # determinate progress: (row idx, percent, stage name), emitted by the
+    # calculator at phase boundaries instead of polling from the GUI side
+    progress = pyqtSignal(int, int, str)
+
+
+class PSFComputeJob(QRunnable):
+    """pooled PSF computation for one table row
+
+    rows are independent, so submitting one job per row to
+    QThreadPool.globalInstance() runs them on all cores
+    """
+
+    def __init__(self, idx: int, params: dict, signals: PSFJobSignals,
+                 generation: int = 0):
         super().__init__()
+        self.idx = idx
         self.params = params
+        self.signals = signals
+        self.generation = generation
+        self.cancelled = False
 
     def run(self):
+        if self.cancelled:
+            return
+
         try:
             start_time = time.time()
 
-            logger.info(f"Starting PSF computation with params: {self.params}")
-
             calc = PSFCalculator()
-            psf_data = calc.compute(**self.params)
+            psf_data = calc.compute(
+                **self.params,
+                progress_cb=lambda pct, stage: self.signals.progress.emit(
+                    self.idx, pct, stage))
 
             elapsed_time = time.time() - start_time
 
-            step_microns = calc.get_step_microns()
-
+            # lazy %s formatting: skipped entirely when the level is off
             logger.info(
-                f"PSF computation completed: {psf_data.shape}, {elapsed_time:.3f}s")
+                "Row %d PSF computed in pool: %s, %.3fs",
+                self.idx + 1, psf_data.shape, elapsed_time)
 
-            self.result_ready.emit(psf_data, elapsed_time, {
-                'step_microns': step_microns})
+            self.signals.result_ready.emit(
+                self.generation, self.idx, psf_data, elapsed_time,
+                _result_info(calc, psf_data))
         except Exception as e:
-            logger.error(f"PSF computation failed: {e}", exc_info=True)
-            self.error_occurred.emit(str(e))
+            logger.error(
+                "Pooled PSF computation failed: %s", e, exc_info=True)
+            self.signals.error_occurred.emit(self.generation, self.idx, str(e))
@@ -27,7 +27,13 @@ class OpticalSystemRow:
 
     # results
     psf_data: Optional[np.ndarray] = None
+    # cached rfft2 of psf_data for system-PSF accumulation
+    psf_fft: Optional[np.ndarray] = None
+    psf_fft_shape: Optional[tuple] = None
+    # fp16 preview copy (low-memory preview mode only)
+    psf_display: Optional[np.ndarray] = None
     strehl_ratio: float = 0.0
+    psf_max: float = 0.0  # peak intensity, computed in the worker thread
     status: str = "not_computed"  # not_computed, computing, complete, error
     error_message: str = ""
     compute_time: float = 0.0
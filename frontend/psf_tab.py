@@ -9,16 +9,21 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QPushButton,
     QLabel, QMenu, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QMarginsF, QRectF
+from PyQt6.QtCore import Qt, pyqtSignal, QMarginsF, QRectF, QTimer
 from PyQt6.QtPrintSupport import QPrinter, QPrintDialog, QPrintPreviewDialog
-from PyQt6.QtGui import QPageLayout, QPageSize
+from PyQt6.QtGui import (QPageLayout, QPageSize, QPainter, QFont,
+                         QTextDocument, QImage)
+from datetime import datetime
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
 from psf_wrapper import PSFCalculator
 
 # import new modular components
 from frontend.models import OpticalSystemRow
 from frontend.handlers import TableHandler, ComputeHandler, FileHandler
-from frontend.ui_components import ControlPanel, create_optical_table
-from frontend.utils import calculate_step_params
+from frontend.ui_components import Col, ControlPanel, create_optical_table
+from frontend.utils import calculate_step_params, calculate_step_params_vec
 from frontend.widgets.plot_widget import PlotWidget
 
 logger = logging.getLogger(__name__)
@@ -30,6 +35,7 @@ sys.path.insert(0, os.path.join(
 class PSFTab(QWidget):
     """Main PSF Calculator Tab - Controller"""
 
+    # emits the displayed PSF as float32 (display copy; rows keep full precision)
     psf_computed = pyqtSignal(np.ndarray)
 
     def __init__(self, parent=None):
@@ -46,6 +52,7 @@ class PSFTab(QWidget):
 
         # current displayed PSF
         self.current_psf = None
+        self.current_psf_max = 0.0  # cached peak, avoids rescans in _update_info
         self.current_params = None
         self.current_step_microns = None
         self.current_compute_time = None
@@ -60,21 +67,40 @@ class PSFTab(QWidget):
         # computation state
         self.compute_system_after = False
         self.current_units = 'microns'
-
-        # column indices
-        self.COL_LAMBDA = 0
-        self.COL_NA = 1
-        self.COL_MAG = 2
-        self.COL_DEFOC = 3
-        self.COL_ASTIG = 4
-        self.COL_STEP_OBJ_CAN = 5
-        self.COL_STEP_OBJ_UM = 6
-        self.COL_STEP_IM_CAN = 7
-        self.COL_STEP_IM_UM = 8
-        self.COL_DIAM_PUP = 9
-        self.COL_STEP_PUP = 10
-        self.COL_STREHL = 11
-        self.COL_STATUS = 12
+        self.low_memory_preview = False
+
+        # coords cache for plotting: (size, step, λ, NA) -> {units: (coords, label)}
+        self._coords_cache = {}
+
+        # cached plot artists; lets a units toggle update coordinates
+        # in place instead of rebuilding imshow/plot from scratch
+        self._im = None
+        self._line_x = None
+        self._line_y = None
+        # block-mean factor of the displayed image vs the full-res PSF
+        self._im_block_factor = 1
+
+        # normalized PSF + cross-sections, keyed by the displayed array
+        # identity so full replots of the same PSF skip the O(N^2) work
+        self._norm_src = None
+        self._psf_norm = None
+        self._x_section = None
+        self._y_section = None
+
+        # debounce rapid control changes: only the final value triggers
+        # the O(N) apply-to-all-rows pass
+        self._pending_source_value = None
+        self._source_value_debounce = QTimer(self)
+        self._source_value_debounce.setSingleShot(True)
+        self._source_value_debounce.setInterval(150)
+        self._source_value_debounce.timeout.connect(
+            self._flush_source_param_value)
+
+        self._pending_sample_size = None
+        self._sample_size_debounce = QTimer(self)
+        self._sample_size_debounce.setSingleShot(True)
+        self._sample_size_debounce.setInterval(150)
+        self._sample_size_debounce.timeout.connect(self._flush_sample_size)
 
         self._create_ui()
         logger.info("Optical System Analyzer tab UI created")
@@ -114,6 +140,8 @@ class PSFTab(QWidget):
             self._on_source_param_value_changed)
         self.control_panel.sample_size_changed.connect(
             self._on_sample_size_changed)
+        self.control_panel.low_memory_preview_changed.connect(
+            self._on_low_memory_preview_changed)
 
         # access widgets for compatibility
         self.param_choice_combo = self.control_panel.param_choice_combo
@@ -133,6 +161,7 @@ class PSFTab(QWidget):
         self.table.itemChanged.connect(self._on_table_item_changed)
         self.table.customContextMenuRequested.connect(
             self._on_table_context_menu)
+        self._build_context_menu()
 
         main_layout.addWidget(self.table, stretch=5)
 
@@ -218,9 +247,7 @@ class PSFTab(QWidget):
 
     def _initialize_default_rows(self):
         """initialize with 3 default rows"""
-        for _ in range(3):
-            row = OpticalSystemRow()
-            self.table_handler.add_row(row)
+        self.table_handler.add_rows([OpticalSystemRow() for _ in range(3)])
 
         # select first row
         if self.table_rows:
@@ -242,22 +269,57 @@ class PSFTab(QWidget):
         # use calculations module
         result = calculate_step_params(row, choice, units)
 
-        if result:
-            row.diam_pupil = result['diam_pupil']
-            row.step_pupil = result['step_pupil']
-            row.step_obj_can = result['step_obj_can']
-            row.step_im_can = result['step_im_can']
-            row.step_obj_microns = result['step_obj_microns']
-            row.step_im_microns = result['step_im_microns']
+        if result is not None:
+            (row.diam_pupil, row.step_pupil,
+             row.step_obj_can, row.step_im_can,
+             row.step_obj_microns, row.step_im_microns) = result
 
     # ===== EVENT HANDLERS - UI =====
 
     def _on_units_changed(self, units: str):
         """units changed"""
         self.current_units = units
-        if self.current_psf is not None:
+        if self.current_psf is None:
+            return
+
+        # pixel data is unchanged, only the coordinate axes move:
+        # reuse the existing artists when we have them
+        if self._im is not None and self._line_x is not None:
+            self._reskin_axes()
+        else:
             self._update_plots()
 
+    def _on_low_memory_preview_changed(self, enabled: bool):
+        """low-memory preview toggled"""
+        self.low_memory_preview = enabled
+        if not enabled:
+            # drop fp16 copies, they are only kept for this mode
+            for row in self.table_rows:
+                row.psf_display = None
+        logger.info(f"Low-memory preview: {enabled}")
+
+        # refresh the displayed row in the new precision
+        idx = self.selected_row_idx
+        if self.current_psf is not None and 0 <= idx < len(self.table_rows):
+            row = self.table_rows[idx]
+            if row.status == "complete" and row.psf_data is not None:
+                self.current_psf = self._display_copy(row.psf_data, row)
+                self._update_plots()
+
+    def _display_copy(self, psf_data, row=None):
+        """display copy of a PSF: fp16 in low-memory mode, fp32 otherwise
+
+        rows keep the full-precision psf_data for Strehl and system
+        convolution; only the preview path is quantized
+        """
+        if self.low_memory_preview:
+            if row is not None:
+                if row.psf_display is None:
+                    row.psf_display = psf_data.astype(np.float16)
+                return row.psf_display
+            return psf_data.astype(np.float16)
+        return psf_data.astype(np.float32, copy=False)
+
     def _on_param_choice_changed(self, choice: str):
         """source parameter choice changed"""
         self._recalculate_all_rows_params()
@@ -275,11 +337,20 @@ class PSFTab(QWidget):
         self.table_handler.refresh_column_colors()
 
     def _on_source_param_value_changed(self, value: float):
-        """source parameter value changed - apply to ALL rows"""
+        """source parameter value changed - debounced apply to ALL rows"""
         if not self.table_rows:
             return
 
-        choice = self.param_choice_combo.currentText()
+        self._pending_source_value = value
+        self._source_value_debounce.start()
+
+    def _flush_source_param_value(self):
+        """apply the last pending source parameter value"""
+        if self._pending_source_value is None:
+            return
+
+        value = self._pending_source_value
+        self._pending_source_value = None
         units = self.source_param_units_combo.currentText()
 
         self._apply_source_param_to_all_rows(value, units)
@@ -291,56 +362,104 @@ class PSFTab(QWidget):
 
         choice = self.param_choice_combo.currentText()
 
-        # apply to all rows
-        for idx, row in enumerate(self.table_rows):
-            if choice == 'Diam pupil':
-                row.diam_pupil = value
-            elif choice == 'Step pupil':
-                row.step_pupil = value
-            elif choice == 'Step object':
-                if units == 'c.u.':
-                    row.step_obj_can = value
-                else:
-                    row.step_obj_microns = value
-            elif choice == 'Step image':
-                if units == 'c.u.':
-                    row.step_im_can = value
-                else:
-                    row.step_im_microns = value
-
-            row.status = "not_computed"
-            row.strehl_ratio = 0.0
-            row.psf_data = None
-
-            self._recalculate_row_params(idx)
-            self.table_handler.update_table_row(idx)
+        # apply to all rows, repainting the table once at the end
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            for idx, row in enumerate(self.table_rows):
+                if choice == 'Diam pupil':
+                    row.diam_pupil = value
+                elif choice == 'Step pupil':
+                    row.step_pupil = value
+                elif choice == 'Step object':
+                    if units == 'c.u.':
+                        row.step_obj_can = value
+                    else:
+                        row.step_obj_microns = value
+                elif choice == 'Step image':
+                    if units == 'c.u.':
+                        row.step_im_can = value
+                    else:
+                        row.step_im_microns = value
+
+                row.status = "not_computed"
+                row.strehl_ratio = 0.0
+                row.psf_data = None
+
+                self._recalculate_row_params(idx)
+                self.table_handler.update_table_row(idx)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
 
         self.system_psf_valid = False
         logger.info(
             f"Source parameter '{choice}' set to {value} {units} for all {len(self.table_rows)} rows")
 
     def _on_sample_size_changed(self, size: int):
-        """sample size changed - apply to ALL rows"""
+        """sample size changed - debounced apply to ALL rows"""
         if not self.table_rows:
             return
 
-        for idx, row in enumerate(self.table_rows):
-            row.sample_size = size
-            row.status = "not_computed"
-            row.strehl_ratio = 0.0
-            row.psf_data = None
+        self._pending_sample_size = size
+        self._sample_size_debounce.start()
 
-            self._recalculate_row_params(idx)
-            self.table_handler.update_table_row(idx)
+    def _flush_sample_size(self):
+        """apply the last pending sample size"""
+        if self._pending_sample_size is None:
+            return
+
+        size = self._pending_sample_size
+        self._pending_sample_size = None
+
+        # repaint the table once after all rows are updated
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            for idx, row in enumerate(self.table_rows):
+                row.sample_size = size
+                row.status = "not_computed"
+                row.strehl_ratio = 0.0
+                row.psf_data = None
+
+                self._recalculate_row_params(idx)
+                self.table_handler.update_table_row(idx)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
 
         self.system_psf_valid = False
         logger.info(f"Sample size set to {size} for all {len(self.table_rows)} rows")
 
     def _recalculate_all_rows_params(self):
-        """recalculate params for all rows"""
-        for idx in range(len(self.table_rows)):
-            self._recalculate_row_params(idx)
-            self.table_handler.update_table_row(idx)
+        """recalculate params for all rows (vectorized across rows)"""
+        if not self.table_rows:
+            return
+
+        choice = self.param_choice_combo.currentText()
+        units = self.source_param_units_combo.currentText()
+
+        result = calculate_step_params_vec(self.table_rows, choice, units)
+        if not result:
+            return
+
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            for idx, row in enumerate(self.table_rows):
+                row.diam_pupil = float(result['diam_pupil'][idx])
+                row.step_pupil = float(result['step_pupil'][idx])
+                row.step_obj_can = float(result['step_obj_can'][idx])
+                row.step_im_can = float(result['step_im_can'][idx])
+                row.step_obj_microns = float(result['step_obj_microns'][idx])
+                row.step_im_microns = float(result['step_im_microns'][idx])
+                self.table_handler.update_table_row(idx)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
 
     # ===== EVENT HANDLERS - TABLE =====
 
@@ -360,7 +479,8 @@ class PSFTab(QWidget):
         if row_idx >= 0 and row_idx < len(self.table_rows):
             row = self.table_rows[row_idx]
             if row.status == "complete" and row.psf_data is not None:
-                self.current_psf = row.psf_data
+                self.current_psf = self._display_copy(row.psf_data, row)
+                self.current_psf_max = row.psf_max
                 self.current_params = row.get_params()
                 self.current_step_microns = row.step_obj_microns
                 self.current_compute_time = row.compute_time
@@ -401,15 +521,15 @@ class PSFTab(QWidget):
             return
 
         # apply value
-        if col_idx == self.COL_LAMBDA:
+        if col_idx == Col.LAMBDA:
             row.wavelength = value
-        elif col_idx == self.COL_NA:
+        elif col_idx == Col.NA:
             row.back_aperture = value
-        elif col_idx == self.COL_MAG:
+        elif col_idx == Col.MAG:
             row.magnification = value
-        elif col_idx == self.COL_DEFOC:
+        elif col_idx == Col.DEFOC:
             row.defocus = value
-        elif col_idx == self.COL_ASTIG:
+        elif col_idx == Col.ASTIG:
             row.astigmatism = value
         else:
             return
@@ -419,57 +539,79 @@ class PSFTab(QWidget):
         row.psf_data = None
         self.system_psf_valid = False
 
-        self._recalculate_row_params(row_idx)
+        # defocus/astigmatism don't affect pupil/step geometry, so only
+        # recalculate the derived params when λ, NA or magnification changed
+        if col_idx in (Col.LAMBDA, Col.NA, Col.MAG):
+            self._recalculate_row_params(row_idx)
         self.table_handler.update_table_row(row_idx)
 
         logger.info(f"Row {row_idx + 1} modified")
 
+    def _build_context_menu(self):
+        """build the table context menu once; reused for every right-click"""
+        self._current_ctx_row = -1
+
+        self._ctx_menu = QMenu(self)
+        self._act_add_before = self._ctx_menu.addAction("Add Row Before")
+        self._act_add_after = self._ctx_menu.addAction("Add Row After")
+        self._ctx_menu.addSeparator()
+        self._act_randomize = self._ctx_menu.addAction("Randomize")
+        self._act_reset = self._ctx_menu.addAction("Reset to Default")
+        self._ctx_menu.addSeparator()
+        self._act_delete = self._ctx_menu.addAction("Delete Row")
+
+        self._act_add_before.triggered.connect(
+            lambda: self.table_handler.insert_row_before(self._current_ctx_row))
+        self._act_add_after.triggered.connect(
+            lambda: self.table_handler.insert_row_after(self._current_ctx_row))
+        self._act_randomize.triggered.connect(
+            lambda: self.table_handler.randomize_row(self._current_ctx_row))
+        self._act_reset.triggered.connect(
+            lambda: self.table_handler.reset_row(self._current_ctx_row))
+        self._act_delete.triggered.connect(
+            lambda: self.table_handler.delete_row(self._current_ctx_row))
+
     def _on_table_context_menu(self, pos):
         """show context menu for table"""
         index = self.table.indexAt(pos)
         if not index.isValid():
             return
 
-        row_idx = index.row()
+        self._current_ctx_row = index.row()
+        self._ctx_menu.exec(self.table.viewport().mapToGlobal(pos))
 
-        menu = QMenu(self)
-
-        add_before_action = menu.addAction("Add Row Before")
-        add_after_action = menu.addAction("Add Row After")
-        menu.addSeparator()
-        randomize_action = menu.addAction("Randomize")
-        reset_action = menu.addAction("Reset to Default")
-        menu.addSeparator()
-        delete_action = menu.addAction("Delete Row")
+    # ===== EVENT HANDLERS - BUTTONS =====
 
-        action = menu.exec(self.table.viewport().mapToGlobal(pos))
+    def _flush_pending_edits(self):
+        """apply debounced control edits immediately
 
-        if action == add_before_action:
-            self.table_handler.insert_row_before(row_idx)
-        elif action == add_after_action:
-            self.table_handler.insert_row_after(row_idx)
-        elif action == randomize_action:
-            self.table_handler.randomize_row(row_idx)
-        elif action == reset_action:
-            self.table_handler.reset_row(row_idx)
-        elif action == delete_action:
-            self.table_handler.delete_row(row_idx)
-
-    # ===== EVENT HANDLERS - BUTTONS =====
+        the source-value and sample-size debounce timers coalesce rapid
+        changes; a compute click inside that window must not race the
+        timer and run with stale row parameters
+        """
+        if self._source_value_debounce.isActive():
+            self._source_value_debounce.stop()
+            self._flush_source_param_value()
+        if self._sample_size_debounce.isActive():
+            self._sample_size_debounce.stop()
+            self._flush_sample_size()
 
     def _on_compute_all_clicked(self):
         """compute all rows"""
+        self._flush_pending_edits()
         indices = list(range(len(self.table_rows)))
         self.compute_handler.compute_multiple_rows(indices)
 
     def _on_compute_selected_clicked(self):
         """compute selected rows"""
+        self._flush_pending_edits()
         selected_rows = set(index.row()
                             for index in self.table.selectedIndexes())
         self.compute_handler.compute_multiple_rows(list(selected_rows))
 
     def _on_compute_system_clicked(self):
         """compute system PSF"""
+        self._flush_pending_edits()
         if not self.table_rows:
             QMessageBox.information(
                 self, "No Rows", "No rows to compute system PSF.")
@@ -539,6 +681,29 @@ class PSFTab(QWidget):
 
     # ===== VISUALIZATION =====
 
+    def _get_plot_coords(self, size):
+        """get coordinate axis and unit label for current units
+
+        all three unit systems are built together on the first request
+        for a grid, so toggling the units radio is a pure dict lookup
+        """
+        key = (size, self.current_step_microns,
+               self.current_params.get('wavelength'),
+               self.current_params.get('back_aperture'))
+        per_units = self._coords_cache.get(key)
+        if per_units is None:
+            pixels = np.arange(size) - size // 2
+            step_canonical = (
+                self.current_params['wavelength'] / self.current_params['back_aperture']) / size
+            per_units = {
+                'microns': (pixels * self.current_step_microns, 'μm'),
+                'canonical': (pixels * step_canonical, 'canonical units'),
+                'pixels': (pixels, 'pixels'),
+            }
+            self._coords_cache[key] = per_units
+
+        return per_units[self.current_units]
+
     def _update_plots(self):
         """update PSF plots"""
         if self.current_psf is None:
@@ -547,69 +712,158 @@ class PSFTab(QWidget):
         psf = self.current_psf
         size = psf.shape[0]
 
-        # normalize PSF to max=1 for better visualization
-        psf_normalized = psf / np.max(psf) if np.max(psf) > 0 else psf
-
-        if self.current_units == 'microns':
-            coords = np.arange(size) * self.current_step_microns
-            coords = coords - coords[size // 2]
-            unit_label = 'μm'
-        elif self.current_units == 'canonical':
-            step_canonical = (
-                self.current_params['wavelength'] / self.current_params['back_aperture']) / size
-            coords = np.arange(size) * step_canonical
-            coords = coords - coords[size // 2]
-            unit_label = 'canonical units'
-        else:
-            coords = np.arange(size)
-            coords = coords - size // 2
-            unit_label = 'pixels'
-
-        self.plot_cross_sections.clear()
-        self.plot_2d_psf.clear()
+        if self._norm_src is not psf:
+            # normalize PSF to max=1 for better visualization
+            # (single max pass + multiply instead of two max scans and a divide)
+            pmax = float(psf.max())
+            psf_normalized = psf * (1.0 / pmax) if pmax > 0 else psf
+            center_idx = size // 2
+
+            self._norm_src = psf
+            self._psf_norm = psf_normalized
+            self._x_section = psf_normalized[center_idx, :]
+            # column slice is strided; make it contiguous here instead of
+            # letting Line2D copy it internally on every draw
+            self._y_section = np.ascontiguousarray(
+                psf_normalized[:, center_idx])
+
+        psf_normalized = self._psf_norm
+
+        coords, unit_label = self._get_plot_coords(size)
+
+        # the canvas only has ~500-600 px anyway: block-mean large PSFs
+        # down to the display scale instead of rasterizing the full grid
+        # (cross-sections and current_psf keep full resolution)
+        psf_display = psf_normalized
+        self._im_block_factor = 1
+        widget_px = max(self.plot_2d_psf.width(),
+                        self.plot_2d_psf.height(), 512)
+        target = 1 << (widget_px - 1).bit_length()  # next power of two
+        if size > target and size % target == 0:
+            factor = size // target
+            psf_display = psf_normalized.reshape(
+                target, factor, target, factor).mean(axis=(1, 3))
+            self._im_block_factor = factor
+
+        # quantize the display image to uint8: matplotlib skips float
+        # normalization and AGG uploads a quarter of the bytes; the
+        # cross-sections stay float so no precision is lost where it shows
+        psf_display = (psf_display * np.float32(255.0)).astype(np.uint8)
 
         ax0 = self.plot_cross_sections.get_axes()
-        center_idx = size // 2
+        ax1 = self.plot_2d_psf.get_axes()
 
-        x_section = psf_normalized[center_idx, :]
-        ax0.plot(coords, x_section, 'r-', label='X section', linewidth=2)
+        reuse = (self._im is not None and self._line_x is not None
+                 and self._im.get_size() == psf_display.shape)
+        if reuse:
+            # push new data into the persistent artists instead of tearing
+            # them down; static decoration (titles, legend, grid) survives
+            self._line_x.set_data(coords, self._x_section)
+            self._line_y.set_data(coords, self._y_section)
+            ax0.relim()
+            ax0.autoscale_view()
+            ax0.set_xlabel(f'Position [{unit_label}]')
+
+            self._im.set_data(psf_display)
+            self._apply_image_tick_units()
+
+            self.plot_cross_sections.canvas.draw_idle()
+            self.plot_2d_psf.canvas.draw_idle()
+        else:
+            # first paint: create the artists once
+            self.plot_cross_sections.clear()
+            self.plot_2d_psf.clear()
+            ax0 = self.plot_cross_sections.get_axes()
+            ax1 = self.plot_2d_psf.get_axes()
+
+            (self._line_x,) = ax0.plot(
+                coords, self._x_section, 'r-', label='X section', linewidth=2)
+            (self._line_y,) = ax0.plot(
+                coords, self._y_section, 'b-', label='Y section', linewidth=2)
+
+            ax0.set_xlabel(f'Position [{unit_label}]')
+            ax0.set_ylabel('Normalized Intensity')
+            ax0.set_title('PSF Cross-Sections')
+            ax0.legend()
+            ax0.grid(True, alpha=0.3)
+            ax0.set_aspect('auto')
+
+            # native pixel coords: tick formatters map pixels to units, so
+            # matplotlib never retransforms the image for a units change
+            self._im = ax1.imshow(psf_display, cmap='gray',
+                                  origin='lower', aspect='equal',
+                                  vmin=0, vmax=255)
+            self._apply_image_tick_units()
+            ax1.set_title('2D PSF (Grayscale)')
+            ax1.set_aspect('equal', adjustable='box')
+
+            self.plot_cross_sections.refresh()
+            self.plot_2d_psf.refresh()
+
+        # send PSF to the image tab as float32 per the signal contract;
+        # in low-memory mode current_psf is the fp16 preview, so widen it
+        self.psf_computed.emit(
+            self.current_psf.astype(np.float32, copy=False))
+        logger.debug(f"PSF data sent to Image Processing tab")
 
-        y_section = psf_normalized[:, center_idx]
-        ax0.plot(coords, y_section, 'b-', label='Y section', linewidth=2)
+    def _apply_image_tick_units(self):
+        """label the pixel-space image axes in the current units
 
-        ax0.set_xlabel(f'Position [{unit_label}]')
-        ax0.set_ylabel('Normalized Intensity')
-        ax0.set_title('PSF Cross-Sections')
-        ax0.legend()
-        ax0.grid(True, alpha=0.3)
-        ax0.set_aspect('auto')
+        the image itself stays in native pixel coords; only the tick
+        formatter changes, so a units toggle never touches the image
+        transform
+        """
+        size = self.current_psf.shape[0]
+        coords, unit_label = self._get_plot_coords(size)
 
-        ax1 = self.plot_2d_psf.get_axes()
-        extent = [coords[0], coords[-1], coords[0], coords[-1]]
+        # display pixel v covers a block of _im_block_factor full-res
+        # pixels; map its coordinate back to the full-res axis
+        step = (coords[1] - coords[0]) * self._im_block_factor
+        origin = float(coords[0])
+        fmt = FuncFormatter(lambda v, pos: f"{origin + v * step:.2f}")
 
-        ax1.imshow(psf_normalized, cmap='gray', extent=extent,
-                   origin='lower', aspect='equal', vmin=0, vmax=1)
+        ax1 = self.plot_2d_psf.get_axes()
+        ax1.xaxis.set_major_formatter(fmt)
+        ax1.yaxis.set_major_formatter(fmt)
         ax1.set_xlabel(f'X [{unit_label}]')
         ax1.set_ylabel(f'Y [{unit_label}]')
-        ax1.set_title('2D PSF (Grayscale)')
-        ax1.set_aspect('equal', adjustable='box')
 
-        self.plot_cross_sections.refresh()
-        self.plot_2d_psf.refresh()
+    def _reskin_axes(self):
+        """re-label axes for new units without re-rendering the PSF data"""
+        size = self.current_psf.shape[0]
+        coords, unit_label = self._get_plot_coords(size)
 
-        # send PSF to image tab
-        self.psf_computed.emit(self.current_psf)
-        logger.debug(f"PSF data sent to Image Processing tab")
+        ax0 = self.plot_cross_sections.get_axes()
+        self._line_x.set_xdata(coords)
+        self._line_y.set_xdata(coords)
+        ax0.relim()
+        ax0.autoscale_view()
+        ax0.set_xlabel(f'Position [{unit_label}]')
+
+        self._apply_image_tick_units()
+
+        self.plot_cross_sections.canvas.draw_idle()
+        self.plot_2d_psf.canvas.draw_idle()
 
     def _clear_plots(self):
         """clear all plots"""
         logger.info("Clearing plots...")
 
         self.current_psf = None
+        self.current_psf_max = 0.0
         self.current_params = {}
         self.current_step_microns = 0.0
         self.current_compute_time = 0.0
         self.current_strehl_ratio = None
+        self._coords_cache.clear()
+        self._im = None
+        self._line_x = None
+        self._line_y = None
+        self._im_block_factor = 1
+        self._norm_src = None
+        self._psf_norm = None
+        self._x_section = None
+        self._y_section = None
 
         self.plot_cross_sections.clear()
         self.plot_2d_psf.clear()
@@ -623,19 +877,16 @@ class PSFTab(QWidget):
         if self.current_psf is None:
             return
 
-        max_intensity = float(np.max(self.current_psf))
-
-        # use stored Strehl ratio (set when PSF is displayed)
+        # peak is cached when the PSF is displayed; no full-array scan here
         self.control_panel.update_info(
-            max_intensity, self.current_compute_time, self.current_strehl_ratio)
+            self.current_psf_max, self.current_compute_time,
+            self.current_strehl_ratio)
 
     # ===== PRINT OPERATIONS =====
 
     def _print_report(self):
         """print report using QPrintDialog"""
         try:
-            from datetime import datetime
-            import os
 
             # create printer with default settings
             printer = QPrinter(QPrinter.PrinterMode.ScreenResolution)
@@ -663,8 +914,6 @@ class PSFTab(QWidget):
     def _print_preview(self):
         """print preview using QPrintPreviewDialog"""
         try:
-            from datetime import datetime
-            import os
 
             # create printer with default settings
             printer = QPrinter(QPrinter.PrinterMode.ScreenResolution)
@@ -692,10 +941,6 @@ class PSFTab(QWidget):
 
     def _do_print_report(self, printer):
         """format and print the report"""
-        from PyQt6.QtGui import QPainter, QFont, QTextDocument
-        from datetime import datetime
-        from matplotlib.backends.backend_agg import FigureCanvasAgg
-        from matplotlib.figure import Figure
 
         # check if we have any computed data
         computed_rows = [i for i, row in enumerate(
@@ -726,6 +971,11 @@ class PSFTab(QWidget):
         normal_font.setPointSize(10)
         painter.setFont(normal_font)
 
+        # fonts for the plot loop, built once to avoid per-plot
+        # QFont churn and font-metric lookups
+        plot_title_font = QFont(title_font)
+        plot_title_font.setPointSize(11)
+
         # parameters table
         html_table = self._generate_parameters_html()
         doc = QTextDocument()
@@ -787,8 +1037,7 @@ class PSFTab(QWidget):
                     painter, page_rect, font_height, page_num)
 
             # print plot title and info
-            title_font.setPointSize(11)
-            painter.setFont(title_font)
+            painter.setFont(plot_title_font)
             painter.drawText(0, int(y_pos), plot_info['title'])
             y_pos += font_height * 1.2
             painter.setFont(normal_font)
@@ -797,7 +1046,8 @@ class PSFTab(QWidget):
 
             # print plot
             actual_plot_height = self._print_single_psf(
-                painter, int(y_pos), page_rect.width(), plot_info['row'])
+                painter, int(y_pos), page_rect.width(), plot_info['row'],
+                target_dpi=printer.resolution())
             y_pos += actual_plot_height + font_height * 1
 
         self._print_footer(painter, page_rect, font_height, page_num)
@@ -806,7 +1056,6 @@ class PSFTab(QWidget):
 
     def _print_header(self, painter, page_rect, font_height, page_num):
         """print page header, returns y_pos after header"""
-        from datetime import datetime
         y_pos = 0
         painter.drawLine(0, y_pos, int(page_rect.width()), y_pos)
         painter.drawText(0, y_pos - int(font_height * 0.5),
@@ -867,12 +1116,8 @@ class PSFTab(QWidget):
 
         return html
 
-    def _print_single_psf(self, painter, y_pos, width, row):
+    def _print_single_psf(self, painter, y_pos, width, row, target_dpi=100):
         """print PSF plots for a single row"""
-        from matplotlib.backends.backend_agg import FigureCanvasAgg
-        from matplotlib.figure import Figure
-        from PyQt6.QtGui import QImage
-
         if row.psf_data is None:
             return 0
 
@@ -880,8 +1125,11 @@ class PSFTab(QWidget):
         size = psf.shape[0]
         psf_normalized = psf / np.max(psf) if np.max(psf) > 0 else psf
 
-        # create matplotlib figure
-        fig = Figure(figsize=(10, 3.5), dpi=100)
+        # render straight at the printer's resolution so Qt draws the
+        # image 1:1 instead of upscaling a screen-resolution raster
+        target_width = int(width * 0.9)
+        w_in = target_width / target_dpi
+        fig = Figure(figsize=(w_in, w_in * 0.35), dpi=target_dpi)
 
         # plot 1: cross sections
         ax1 = fig.add_subplot(1, 2, 1)
@@ -894,7 +1142,7 @@ class PSFTab(QWidget):
 
         x_section = psf_normalized[center_idx, :]
         ax1.plot(coords, x_section, 'r-', label='X section', linewidth=2)
-        y_section = psf_normalized[:, center_idx]
+        y_section = np.ascontiguousarray(psf_normalized[:, center_idx])
         ax1.plot(coords, y_section, 'b-', label='Y section', linewidth=2)
         ax1.set_xlabel(f'Position [{unit_label}]')
         ax1.set_ylabel('Normalized Intensity')
@@ -914,7 +1162,7 @@ class PSFTab(QWidget):
 
         fig.tight_layout()
 
-        # render figure to QImage
+        # render figure to QImage at native print resolution
         canvas = FigureCanvasAgg(fig)
         canvas.draw()
         buf = canvas.buffer_rgba()
@@ -922,11 +1170,7 @@ class PSFTab(QWidget):
         qimage = QImage(buf, width_px, height_px,
                         QImage.Format.Format_RGBA8888)
 
-        # scale to fit page width
-        target_width = int(width * 0.9)
-        target_height = int(height_px * target_width / width_px)
-
         painter.drawImage(
-            QRectF(0, y_pos, target_width, target_height), qimage)
+            QRectF(0, y_pos, width_px, height_px), qimage)
 
-        return target_height
+        return height_px
@@ -1,6 +1,6 @@
 # frontend UI components
 
 from .control_panel import ControlPanel
-from .table_widget import create_optical_table
+from .table_widget import Col, create_optical_table
 
-__all__ = ['ControlPanel', 'create_optical_table']
+__all__ = ['Col', 'ControlPanel', 'create_optical_table']
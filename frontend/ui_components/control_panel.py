@@ -1,7 +1,8 @@
 # control panel UI components
 
 from PyQt6.QtWidgets import (QWidget, QGroupBox, QHBoxLayout, QVBoxLayout,
-                             QRadioButton, QButtonGroup, QLabel, QComboBox, QDoubleSpinBox)
+                             QRadioButton, QButtonGroup, QLabel, QComboBox,
+                             QDoubleSpinBox, QCheckBox)
 from PyQt6.QtCore import pyqtSignal
 
 
@@ -13,6 +14,18 @@ class ControlPanel(QWidget):
     source_units_changed = pyqtSignal(str)
     source_value_changed = pyqtSignal(float)
     sample_size_changed = pyqtSignal(int)
+    low_memory_preview_changed = pyqtSignal(bool)
+
+    # spinbox setup per (source param, units):
+    # (min, max, default, decimals, single step)
+    _SPIN_CONFIGS = {
+        ('Diam pupil', 'c.u.'): (0.1, 100.0, 7.5, 3, 0.1),
+        ('Step pupil', 'c.u.'): (0.001, 1.0, 0.015, 6, 0.001),
+        ('Step object', 'c.u.'): (0.001, 10.0, 0.133, 6, 0.01),
+        ('Step object', 'μm'): (0.001, 100.0, 0.073, 6, 0.01),
+        ('Step image', 'c.u.'): (0.001, 10.0, 0.133, 6, 0.01),
+        ('Step image', 'μm'): (0.001, 100.0, 0.462, 6, 0.01),
+    }
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -52,6 +65,15 @@ class ControlPanel(QWidget):
             lambda text: self.sample_size_changed.emit(int(text)))
 
         layout.addWidget(self.sample_size_combo)
+
+        # fp16 display copies: halves preview memory/bandwidth
+        self.low_memory_check = QCheckBox("Low-mem")
+        self.low_memory_check.setToolTip(
+            "Store preview PSFs in half precision (display only)")
+        self.low_memory_check.toggled.connect(
+            self.low_memory_preview_changed.emit)
+        layout.addWidget(self.low_memory_check)
+
         group.setLayout(layout)
 
         return group
@@ -150,6 +172,28 @@ class ControlPanel(QWidget):
         elif self.radio_pixels.isChecked():
             self.units_changed.emit('pixels')
 
+    def _configure_spin(self, param: str, units: str, silent: bool = False):
+        """apply the spinbox config for (param, units) in one batch
+
+        signals are blocked for the whole reconfiguration and
+        source_value_changed is emitted (at most once) only when the
+        value actually moved, instead of per setRange/setValue call
+        """
+        lo, hi, value, decimals, step = self._SPIN_CONFIGS[(param, units)]
+        spin = self.source_param_spin
+
+        blocked = spin.blockSignals(True)
+        spin.setRange(lo, hi)
+        spin.setDecimals(decimals)
+        spin.setSingleStep(step)
+        changed = abs(spin.value() - value) >= 10 ** -decimals / 2
+        if changed:
+            spin.setValue(value)
+        spin.blockSignals(blocked)
+
+        if changed and not silent:
+            self.source_value_changed.emit(spin.value())
+
     def _on_param_changed(self, param: str):
         """handle source parameter change"""
         # adjust spinbox settings based on parameter
@@ -158,44 +202,14 @@ class ControlPanel(QWidget):
             self.source_param_units_combo.setEnabled(False)
             self.source_param_units_combo.setCurrentText('c.u.')
             self.units_label.setEnabled(False)
-
-            # set range and default value
-            if param == 'Diam pupil':
-                self.source_param_spin.setRange(0.1, 100.0)
-                self.source_param_spin.setValue(7.5)
-                self.source_param_spin.setDecimals(3)
-                self.source_param_spin.setSingleStep(0.1)
-            else:  # Step pupil
-                self.source_param_spin.setRange(0.001, 1.0)
-                self.source_param_spin.setValue(0.015)
-                self.source_param_spin.setDecimals(6)
-                self.source_param_spin.setSingleStep(0.001)
+            units = 'c.u.'
         else:
             # for Step object and Step image, both c.u. and μm are available
             self.source_param_units_combo.setEnabled(True)
             self.units_label.setEnabled(True)
-
-            # get current units
             units = self.source_param_units_combo.currentText()
 
-            if param == 'Step object':
-                if units == 'c.u.':
-                    self.source_param_spin.setRange(0.001, 10.0)
-                    self.source_param_spin.setValue(0.133)
-                else:  # μm
-                    self.source_param_spin.setRange(0.001, 100.0)
-                    self.source_param_spin.setValue(0.073)
-                self.source_param_spin.setDecimals(6)
-                self.source_param_spin.setSingleStep(0.01)
-            else:  # Step image
-                if units == 'c.u.':
-                    self.source_param_spin.setRange(0.001, 10.0)
-                    self.source_param_spin.setValue(0.133)
-                else:  # μm
-                    self.source_param_spin.setRange(0.001, 100.0)
-                    self.source_param_spin.setValue(0.462)
-                self.source_param_spin.setDecimals(6)
-                self.source_param_spin.setSingleStep(0.01)
+        self._configure_spin(param, units)
 
         # emit signal after updating units state
         self.source_param_changed.emit(param)
@@ -207,24 +221,8 @@ class ControlPanel(QWidget):
         if param not in ['Step object', 'Step image']:
             return
 
-        self.source_param_spin.blockSignals(True)
-
-        if param == 'Step object':
-            if units == 'c.u.':
-                self.source_param_spin.setRange(0.001, 10.0)
-                self.source_param_spin.setValue(0.133)
-            else:  # μm
-                self.source_param_spin.setRange(0.001, 100.0)
-                self.source_param_spin.setValue(0.073)
-        else:  # Step image
-            if units == 'c.u.':
-                self.source_param_spin.setRange(0.001, 10.0)
-                self.source_param_spin.setValue(0.133)
-            else:  # μm
-                self.source_param_spin.setRange(0.001, 100.0)
-                self.source_param_spin.setValue(0.462)
-
-        self.source_param_spin.blockSignals(False)
+        # silent: the caller reads the new value and applies it itself
+        self._configure_spin(param, units, silent=True)
 
     def update_info(self, max_intensity: float, compute_time: float, strehl_ratio: float = None):
         """update information label"""
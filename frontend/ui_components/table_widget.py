@@ -1,14 +1,33 @@
 # table widget setup
 
+from enum import IntEnum
+
 from PyQt6.QtWidgets import QTableWidget, QHeaderView, QAbstractItemView
 from PyQt6.QtCore import Qt
 
 
+class Col(IntEnum):
+    """column indices of the optical system table"""
+    LAMBDA = 0
+    NA = 1
+    MAG = 2
+    DEFOC = 3
+    ASTIG = 4
+    STEP_OBJ_CAN = 5
+    STEP_OBJ_UM = 6
+    STEP_IM_CAN = 7
+    STEP_IM_UM = 8
+    DIAM_PUP = 9
+    STEP_PUP = 10
+    STREHL = 11
+    STATUS = 12
+
+
 def create_optical_table() -> QTableWidget:
     """creates and configures the optical system table"""
 
     table = QTableWidget()
-    table.setColumnCount(13)
+    table.setColumnCount(len(Col))
     table.setHorizontalHeaderLabels([
         'λ [μm]', 'NA', 'Mag', 'Defoc [λ]', 'Astig [λ]',
         'Step Obj [c.u.]', 'Step Obj [μm]',
@@ -18,17 +37,17 @@ def create_optical_table() -> QTableWidget:
     ])
 
     # column widths
-    table.setColumnWidth(0, 65)   # λ
-    table.setColumnWidth(1, 50)   # NA
-    table.setColumnWidth(2, 50)   # Mag
-    table.setColumnWidth(3, 70)   # Defoc
-    table.setColumnWidth(4, 70)   # Astig
-    table.setColumnWidth(11, 60)  # Strehl
-    table.setColumnWidth(12, 90)  # Status
+    table.setColumnWidth(Col.LAMBDA, 65)
+    table.setColumnWidth(Col.NA, 50)
+    table.setColumnWidth(Col.MAG, 50)
+    table.setColumnWidth(Col.DEFOC, 70)
+    table.setColumnWidth(Col.ASTIG, 70)
+    table.setColumnWidth(Col.STREHL, 60)
+    table.setColumnWidth(Col.STATUS, 90)
 
     # stretch the computed columns
     header = table.horizontalHeader()
-    for i in range(5, 11):  # Step columns
+    for i in range(Col.STEP_OBJ_CAN, Col.STEP_PUP + 1):
         header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
 
     # dark theme for table
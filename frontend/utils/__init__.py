@@ -1,7 +1,9 @@
 # frontend utilities
 
 from .validators import validate_row_params, validate_numeric_input
-from .calculations import calculate_step_params, calculate_strehl_ratio
+from .calculations import (StepParams, calculate_step_params,
+                           calculate_step_params_vec, calculate_strehl_ratio)
 
 __all__ = ['validate_row_params', 'validate_numeric_input',
-           'calculate_step_params', 'calculate_strehl_ratio']
+           'StepParams', 'calculate_step_params', 'calculate_step_params_vec',
+           'calculate_strehl_ratio']
@@ -1,11 +1,25 @@
 # optical parameter calculations
 
+import functools
 import logging
+from typing import NamedTuple, Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
-def calculate_step_params(row, source_param: str, source_units: str) -> dict:
+class StepParams(NamedTuple):
+    """step parameters derived from one source parameter"""
+    diam_pupil: float
+    step_pupil: float
+    step_obj_can: float
+    step_im_can: float
+    step_obj_microns: float
+    step_im_microns: float
+
+
+def calculate_step_params(row, source_param: str, source_units: str) -> Optional[StepParams]:
     """
     calculate all step parameters based on source parameter
 
@@ -15,82 +29,169 @@ def calculate_step_params(row, source_param: str, source_units: str) -> dict:
         source_units: units for step parameters ('c.u.' or 'μm')
 
     returns:
-        dict with keys: diam_pupil, step_pupil, step_obj_can, step_obj_microns, step_im_can, step_im_microns
+        StepParams, or None for an unknown source parameter
     """
-    sample_size = row.sample_size
+    # pick the one source value the chosen parameter actually reads, so
+    # the memoized core below gets a compact hashable key
+    if source_param == 'Diam pupil':
+        source_value = row.diam_pupil
+    elif source_param == 'Step pupil':
+        source_value = row.step_pupil
+    elif source_param == 'Step object':
+        source_value = (row.step_obj_can if source_units == 'c.u.'
+                        else row.step_obj_microns)
+    elif source_param == 'Step image':
+        source_value = (row.step_im_can if source_units == 'c.u.'
+                        else row.step_im_microns)
+    else:
+        logger.warning(f"Unknown source parameter: {source_param}")
+        return None
+
+    return _calculate_step_params_cached(
+        source_param, source_units, row.sample_size,
+        row.wavelength, row.back_aperture, row.magnification, source_value)
+
+
+@functools.lru_cache(maxsize=256)
+def _calculate_step_params_cached(source_param: str, source_units: str,
+                                  sample_size: int, wavelength: float,
+                                  back_aperture: float, magnification: float,
+                                  source_value: float) -> StepParams:
+    """memoized core of calculate_step_params
 
+    many rows share identical geometry (defaults, copy-paste, apply-to-all),
+    so repeated recalcs hit the cache instead of re-deriving the same values
+    """
     # prevent division by zero
-    wavelength = max(row.wavelength, 0.001)
-    back_aperture = max(row.back_aperture, 0.001)
-    magnification = max(row.magnification, 0.001)
+    wavelength = max(wavelength, 0.001)
+    back_aperture = max(back_aperture, 0.001)
+    magnification = max(magnification, 0.001)
     aperture = magnification * back_aperture
 
-    result = {}
-
     if source_param == 'Diam pupil':
-        diam_pupil = max(row.diam_pupil, 0.001)
+        diam_pupil = max(source_value, 0.001)
         step_pupil = diam_pupil / max(sample_size, 1)
         step_im_can = 1 / max(step_pupil * sample_size, 0.001)
         step_obj_can = step_im_can
 
-        result['diam_pupil'] = diam_pupil
-        result['step_pupil'] = step_pupil
-        result['step_obj_can'] = step_obj_can
-        result['step_im_can'] = step_im_can
-
     elif source_param == 'Step pupil':
-        step_pupil = max(row.step_pupil, 0.001)
+        step_pupil = max(source_value, 0.001)
         diam_pupil = step_pupil * sample_size
         step_im_can = 1 / max(step_pupil * sample_size, 0.001)
         step_obj_can = step_im_can
 
-        result['diam_pupil'] = diam_pupil
-        result['step_pupil'] = step_pupil
-        result['step_obj_can'] = step_obj_can
-        result['step_im_can'] = step_im_can
-
     elif source_param == 'Step object':
         if source_units == 'c.u.':
-            step_obj_can = max(row.step_obj_can, 0.001)
+            step_obj_can = max(source_value, 0.001)
         else:  # μm
-            step_obj_microns = max(row.step_obj_microns, 0.001)
+            step_obj_microns = max(source_value, 0.001)
             step_obj_can = step_obj_microns * aperture / wavelength
 
         step_pupil = 1 / max(step_obj_can * sample_size, 0.001)
         diam_pupil = step_pupil * sample_size
         step_im_can = step_obj_can
 
-        result['diam_pupil'] = diam_pupil
-        result['step_pupil'] = step_pupil
-        result['step_obj_can'] = step_obj_can
-        result['step_im_can'] = step_im_can
-
-    elif source_param == 'Step image':
+    else:  # 'Step image', validated by the caller
         if source_units == 'c.u.':
-            step_im_can = max(row.step_im_can, 0.001)
+            step_im_can = max(source_value, 0.001)
         else:  # μm
-            step_im_microns = max(row.step_im_microns, 0.001)
+            step_im_microns = max(source_value, 0.001)
             step_im_can = step_im_microns * back_aperture / wavelength
 
         step_obj_can = step_im_can
         step_pupil = 1 / max(step_im_can * sample_size, 0.001)
         diam_pupil = step_pupil * sample_size
 
-        result['diam_pupil'] = diam_pupil
-        result['step_pupil'] = step_pupil
-        result['step_obj_can'] = step_obj_can
-        result['step_im_can'] = step_im_can
+    result = StepParams(
+        diam_pupil=diam_pupil,
+        step_pupil=step_pupil,
+        step_obj_can=step_obj_can,
+        step_im_can=step_im_can,
+        # microns from canonical units
+        step_obj_microns=step_obj_can * wavelength / aperture,
+        step_im_microns=step_im_can * wavelength / back_aperture,
+    )
+
+    logger.debug(f"Calculated step params for {source_param}: {result}")
+    return result
+
+
+def calculate_step_params_vec(rows, source_param: str, source_units: str) -> dict:
+    """
+    vectorized calculate_step_params for a list of rows
+
+    same math as calculate_step_params but computed once over
+    length-N numpy arrays instead of one Python call per row
+
+    args:
+        rows: list of OpticalSystemRow
+        source_param: which parameter is the source ('Diam pupil', 'Step pupil', 'Step object', 'Step image')
+        source_units: units for step parameters ('c.u.' or 'μm')
+
+    returns:
+        dict with the same keys as calculate_step_params, values are length-N arrays
+    """
+    if not rows:
+        return {}
+
+    sample_size = np.array([row.sample_size for row in rows], dtype=np.float64)
+    wavelength = np.maximum(
+        [row.wavelength for row in rows], 0.001)
+    back_aperture = np.maximum(
+        [row.back_aperture for row in rows], 0.001)
+    magnification = np.maximum(
+        [row.magnification for row in rows], 0.001)
+    aperture = magnification * back_aperture
+
+    if source_param == 'Diam pupil':
+        diam_pupil = np.maximum([row.diam_pupil for row in rows], 0.001)
+        step_pupil = diam_pupil / np.maximum(sample_size, 1)
+        step_im_can = 1 / np.maximum(step_pupil * sample_size, 0.001)
+        step_obj_can = step_im_can
+
+    elif source_param == 'Step pupil':
+        step_pupil = np.maximum([row.step_pupil for row in rows], 0.001)
+        diam_pupil = step_pupil * sample_size
+        step_im_can = 1 / np.maximum(step_pupil * sample_size, 0.001)
+        step_obj_can = step_im_can
+
+    elif source_param == 'Step object':
+        if source_units == 'c.u.':
+            step_obj_can = np.maximum(
+                [row.step_obj_can for row in rows], 0.001)
+        else:  # μm
+            step_obj_microns = np.maximum(
+                [row.step_obj_microns for row in rows], 0.001)
+            step_obj_can = step_obj_microns * aperture / wavelength
+
+        step_pupil = 1 / np.maximum(step_obj_can * sample_size, 0.001)
+        diam_pupil = step_pupil * sample_size
+        step_im_can = step_obj_can
+
+    elif source_param == 'Step image':
+        if source_units == 'c.u.':
+            step_im_can = np.maximum([row.step_im_can for row in rows], 0.001)
+        else:  # μm
+            step_im_microns = np.maximum(
+                [row.step_im_microns for row in rows], 0.001)
+            step_im_can = step_im_microns * back_aperture / wavelength
+
+        step_obj_can = step_im_can
+        step_pupil = 1 / np.maximum(step_im_can * sample_size, 0.001)
+        diam_pupil = step_pupil * sample_size
 
     else:
         logger.warning(f"Unknown source parameter: {source_param}")
         return {}
 
-    # calculate microns from canonical units
-    result['step_obj_microns'] = result['step_obj_can'] * wavelength / aperture
-    result['step_im_microns'] = result['step_im_can'] * wavelength / back_aperture
-
-    logger.debug(f"Calculated step params for {source_param}: {result}")
-    return result
+    return {
+        'diam_pupil': diam_pupil,
+        'step_pupil': step_pupil,
+        'step_obj_can': step_obj_can,
+        'step_im_can': step_im_can,
+        'step_obj_microns': step_obj_can * wavelength / aperture,
+        'step_im_microns': step_im_can * wavelength / back_aperture,
+    }
 
 
 def calculate_strehl_ratio(psf_data) -> float:
@@ -3,8 +3,11 @@
 
 import sys
 import os
+import atexit
 import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 # пути
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
@@ -141,14 +144,31 @@ def setup_logging():
         log_dir, f'psf_app_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
 
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    formatter = logging.Formatter(log_format)
+
+    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    # records go through a queue to a background listener thread, so
+    # compute workers never block on file/console I/O while holding the
+    # logging lock
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler,
+                             respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # plain pass-through formatter: QueueHandler.prepare would otherwise
+    # bake its default "LEVEL:name:" prefix into the queued message and
+    # the listener's handlers would format it a second time
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
 
     logging.basicConfig(
         level=logging.INFO,
-        format=log_format,
-        handlers=[
-            logging.FileHandler(log_filename, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[queue_handler]
     )
 
     logger = logging.getLogger(__name__)